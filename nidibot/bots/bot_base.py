@@ -69,6 +69,7 @@ class BotBase(ABC):
     def __init__(self, configuration: BotConfiguration, game_servers: List[GameServer]):
         self._configuration = configuration
         self._game_servers = game_servers
+        self._privileged_users = frozenset(self._configuration.privileged_users)
 
         self._backups: Dict[str, List[BackupDescription]] = {}
         self._game_server_names: list = []
@@ -85,16 +86,23 @@ class BotBase(ABC):
         self._emoji_bad = "\U000026D4"
         self._emoji_unknown = "\U00002049\U0000FE0F"
 
+        self._format_title = "{0.game_name} ({0.version}) - {0.address}".format
+        self._format_title_without_version = "{0.game_name} - {0.address}".format
+        self._format_players = "{0.players_connected} / {0.players_limit}".format
+
+        self._status_emojis = {
+            "online": self._emoji_ok,
+            "offline": self._emoji_bad,
+            "restarting": self._emoji_attention,
+        }
+
     def _get_response_title(self, game_server: GameServer) -> str:
         server_status = game_server.status()
 
-        title = f"{server_status.game_name}"
         if server_status.version:
-            title += f" ({server_status.version})"
-
-        title += f" - {server_status.address}"
+            return self._format_title(server_status)
 
-        return title
+        return self._format_title_without_version(server_status)
 
     def _get_game_server(self, server_name: str = "") -> GameServer:
         if not server_name:
@@ -115,7 +123,7 @@ class BotBase(ABC):
         """
 
     @abstractmethod
-    def start(self) -> None:
+    async def start(self) -> None:
         """
-        Starts the bot. Blocking call.
+        Starts the bot and runs it until the event loop cancels it.
         """
@@ -10,11 +10,10 @@ Components for managing Telegram bot.
 
 import asyncio
 import logging
-from datetime import date, datetime
+from datetime import date
 from itertools import chain
 from typing import List, Sequence
 
-import nest_asyncio  # type: ignore
 from telegram import BotCommand, ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
 from telegram.constants import ParseMode
 from telegram.ext import (
@@ -42,12 +41,7 @@ class TelegramBot(BotBase):
         logging.getLogger("httpcore").setLevel(logging.WARNING)
         logging.getLogger("telegram").setLevel(logging.WARNING)
 
-        self.__bot = (
-            Application.builder()
-            .token(self._configuration.token)
-            .post_init(self.__publish_commands)
-            .build()
-        )
+        self.__bot = Application.builder().token(self._configuration.token).build()
 
         (
             self.__PROCESS_OPERATION,
@@ -257,14 +251,9 @@ class TelegramBot(BotBase):
         if command == "status":
             server_status = game_server.status()
 
-            if server_status.status == "online":
-                status_emoji = self._emoji_ok
-            elif server_status.status == "offline":
-                status_emoji = self._emoji_bad
-            elif server_status.status == "restarting":
-                status_emoji = self._emoji_attention
-            else:
-                status_emoji = self._emoji_unknown
+            status_emoji = self._status_emojis.get(
+                server_status.status, self._emoji_unknown
+            )
 
             if server_status.update_available:
                 update_emoji = self._emoji_attention
@@ -273,11 +262,10 @@ class TelegramBot(BotBase):
                 update_emoji = self._emoji_ok
                 update_text = "no"
 
-            date_time = server_status.available_until.split(" ")
-            date_parts = date_time[0].split("-")
-            d0 = date(datetime.now().year, datetime.now().month, datetime.now().day)
-            d1 = date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
-            delta = d1 - d0
+            available_until_date = date.fromisoformat(
+                server_status.available_until[:10]
+            )
+            delta = available_until_date - date.today()
             days_left = f"({delta.days} days left)"
 
             server_name = self._get_response_title(game_server=game_server)
@@ -286,7 +274,7 @@ class TelegramBot(BotBase):
                 f"*Address:* {escape_markdown(server_status.address, version=2)}\n"
             )
             response_text += f"*Status:* {status_emoji} {server_status.status}\n"
-            response_text += f"*Players:* {server_status.players_connected} / {server_status.players_limit}\n"
+            response_text += f"*Players:* {self._format_players(server_status)}\n"
             response_text += f"*Available until:* {escape_markdown(server_status.available_until, version=2)} {escape_markdown(days_left, version=2)}\n"
             response_text += f"*Update available:* {update_emoji} {update_text}"
 
@@ -319,7 +307,7 @@ class TelegramBot(BotBase):
         #
         # Process privileged commands.
         #
-        if username not in self._configuration.privileged_users:
+        if username not in self._privileged_users:
             await update.message.reply_text(
                 f"Sorry but you don't have rights to call this command\\! {self._emoji_no_access}",
                 parse_mode=ParseMode.MARKDOWN_V2,
@@ -335,7 +323,7 @@ class TelegramBot(BotBase):
                 reply_markup=ReplyKeyboardRemove(),
             )
 
-            game_server.start()
+            await asyncio.get_running_loop().run_in_executor(None, game_server.start)
 
         elif command == "stop":
             await context.bot.send_message(
@@ -345,7 +333,7 @@ class TelegramBot(BotBase):
                 reply_markup=ReplyKeyboardRemove(),
             )
 
-            game_server.stop()
+            await asyncio.get_running_loop().run_in_executor(None, game_server.stop)
 
         elif command == "restart":
             await context.bot.send_message(
@@ -355,7 +343,7 @@ class TelegramBot(BotBase):
                 reply_markup=ReplyKeyboardRemove(),
             )
 
-            game_server.restart()
+            await asyncio.get_running_loop().run_in_executor(None, game_server.restart)
 
         elif command == "backup_create":
             await context.bot.send_message(
@@ -365,7 +353,11 @@ class TelegramBot(BotBase):
                 reply_markup=ReplyKeyboardRemove(),
             )
 
-            if game_server.create_backup():
+            #
+            # Backup creation can take minutes, run it outside of the event loop.
+            #
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(None, game_server.create_backup):
                 await context.bot.send_message(
                     chat_id,
                     text=f"{self._emoji_ok} Backup was created successfully\\!",
@@ -414,7 +406,7 @@ class TelegramBot(BotBase):
 
         logging.debug("Called 'backup_restore' by '%s'.", username)
 
-        if username not in self._configuration.privileged_users:
+        if username not in self._privileged_users:
             await update.message.reply_text(
                 f"Sorry but you don't have rights to call this command\\! {self._emoji_no_access}",
                 parse_mode=ParseMode.MARKDOWN_V2,
@@ -540,7 +532,10 @@ class TelegramBot(BotBase):
             reply_markup=ReplyKeyboardRemove(),
         )
 
-        if game_server.restore_backup(backup_description.filepath):
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(
+            None, game_server.restore_backup, backup_description.filepath
+        ):
             await update.message.reply_text(
                 text=f"{self._emoji_ok} Backup from {escaped_backup_name} was restored successfully\\!",
                 parse_mode=ParseMode.MARKDOWN_V2,
@@ -586,25 +581,24 @@ class TelegramBot(BotBase):
             notify_message.message = message
             self._notify_messages.append(notify_message)
 
-    #
-    # A bit of tricky solution to run python-telegram-bot in separate thread.
-    #
-    async def __start_bot(self) -> None:
-        self.__bot.run_polling(
-            allowed_updates=Update.ALL_TYPES,
-            close_loop=False,
-            stop_signals=None,
-            drop_pending_updates=True,
-        )
-
-    def start(self) -> None:
-        nest_asyncio.apply()
-
+    async def start(self) -> None:
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.__start_bot())
-            loop.close()
+            async with self.__bot:
+                await self.__publish_commands(self.__bot)
+                await self.__bot.updater.start_polling(  # type: ignore
+                    allowed_updates=Update.ALL_TYPES,
+                    drop_pending_updates=True,
+                )
+                await self.__bot.start()
+
+                try:
+                    #
+                    # Keep polling until the shared event loop cancels this bot.
+                    #
+                    await asyncio.Event().wait()
+                finally:
+                    await self.__bot.updater.stop()  # type: ignore
+                    await self.__bot.stop()
 
         except Exception as exception:
             logging.exception(exception)
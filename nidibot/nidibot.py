@@ -8,18 +8,26 @@ Main class for nidibot package.
 
 """
 
-import json
+import asyncio
+import atexit
 import logging
 import os
-import pathlib
 import platform
+import queue
 import shutil
 import threading
+import time
 from dataclasses import dataclass, field
-from logging.handlers import TimedRotatingFileHandler
+from importlib.metadata import PackageNotFoundError, version
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    TimedRotatingFileHandler,
+)
 from typing import List
 
-import pkg_resources  # type: ignore
+import orjson
 from dacite import from_dict
 
 from nidibot.bots.bot_base import BotBase, BotConfiguration
@@ -52,6 +60,27 @@ class NidibotConfiguration:
     server_providers: List[ServerProviderConfiguration] = field(default_factory=list)
 
 
+class LogFileHandler(TimedRotatingFileHandler):
+    """
+    A daily rotating log file handler which checks the file type only when rollover is due.
+
+    Some Python versions stat the log file on every emitted record, which
+    is avoided here by comparing the rollover time first.
+    """
+
+    def shouldRollover(self, record) -> bool:
+        current_time = int(time.time())
+        if current_time < self.rolloverAt:
+            return False
+
+        # Never rollover anything other than regular files.
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            self.rolloverAt = self.computeRollover(current_time)
+            return False
+
+        return True
+
+
 class Nidibot:
     """
     Main class for managing all configured bots and game server providers.
@@ -62,6 +91,14 @@ class Nidibot:
             raise ValueError("Working directory value is required for nidibot start!")
 
         self.__working_folder_path = working_folder_path
+
+        try:
+            self.__version = version("nidibot")
+        except PackageNotFoundError:
+            self.__version = ""
+
+        self.__log_format = "%(asctime)s:%(levelname)s:%(funcName)s(): %(message)s"
+        self.__log_flush_interval_seconds = 30
         self.__configuration: NidibotConfiguration = (
             self.__parse_configuration_json_file()
         )
@@ -72,7 +109,8 @@ class Nidibot:
         if os.path.isabs(self.__configuration.general.backups_folder_path):
             root_backup_path = self.__configuration.general.backups_folder_path
 
-        pathlib.Path(root_backup_path).mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(root_backup_path):
+            os.makedirs(root_backup_path, exist_ok=True)
 
         self.__bots: List[BotBase] = []
 
@@ -102,8 +140,8 @@ class Nidibot:
             self.__working_folder_path, "bot_configuration.json"
         )
 
-        with open(configuration_filepath, "r", encoding="utf-8") as json_file:
-            configuration_json = json.load(json_file)
+        with open(configuration_filepath, "rb") as json_file:
+            configuration_json = orjson.loads(json_file.read())
 
         configuration = from_dict(
             data_class=NidibotConfiguration,
@@ -118,24 +156,64 @@ class Nidibot:
         if os.path.isabs(self.__configuration.general.logs_folder_path):
             log_directory = self.__configuration.general.logs_folder_path
 
-        pathlib.Path(log_directory).mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(log_directory):
+            os.makedirs(log_directory, exist_ok=True)
 
         filename = "nidibot.log"
         filepath = os.path.join(log_directory, filename)
 
-        handler = TimedRotatingFileHandler(filepath, when="midnight", backupCount=60)
+        log_formatter = logging.Formatter(self.__log_format)
+
+        handler = LogFileHandler(filepath, when="midnight", backupCount=60)
         handler.suffix = "%Y%m%d"
+        handler.setFormatter(log_formatter)
 
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s:%(levelname)s:%(funcName)s(): %(message)s",
-            handlers=[handler, logging.StreamHandler()],
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(log_formatter)
+
+        #
+        # Buffer file records and write them out in batches: on errors,
+        # when the buffer is full or periodically by a flushing thread.
+        #
+        self.__log_buffer_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=handler,
+            flushOnClose=True,
         )
+        atexit.register(self.__log_buffer_handler.flush)
 
-        logging.getLogger("hikari").setLevel(logging.WARNING)
-        logging.getLogger("lightbulb").setLevel(logging.WARNING)
-        logging.getLogger("requests").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
+        log_flush_thread = threading.Thread(target=self.__flush_logs_periodically)
+        log_flush_thread.daemon = True
+        log_flush_thread.start()
+
+        #
+        # Handlers are served by a listener thread, so logging calls from
+        # bots' event loops only put records into a queue.
+        #
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.__log_listener = QueueListener(
+            log_queue, self.__log_buffer_handler, stream_handler
+        )
+        self.__log_listener.start()
+        atexit.register(self.__log_listener.stop)
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        logging.basicConfig(level=logging.DEBUG, handlers=[queue_handler])
+
+        #
+        # Level set directly on a logger rejects records before a LogRecord is created.
+        # Propagation is kept, so warnings of these libraries still reach the log file.
+        #
+        for logger_name in ("aiohttp", "hikari", "lightbulb", "requests", "urllib3"):
+            logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+    def __flush_logs_periodically(self) -> None:
+        while True:
+            time.sleep(self.__log_flush_interval_seconds)
+            self.__log_buffer_handler.flush()
 
     def __notify_callback(self, title: str, message: str):
         for bot in self.__bots:
@@ -143,27 +221,31 @@ class Nidibot:
 
     def start(self) -> None:
         """
-        Starts all configured bots, each in independent thread.
+        Starts all configured bots on a single event loop.
         Waits until all bots finished their work.
         """
-        try:
-            nidibot_version = pkg_resources.get_distribution("nidibot").version
-            logging.info("nidibot v%s was started.", nidibot_version)
-        except pkg_resources.DistributionNotFound:
+        if self.__version:
+            logging.info("nidibot v%s was started.", self.__version)
+        else:
             logging.debug("nidibot was started.")
 
-        #
-        # Run each bot in separate thread.
-        #
-        threads: list = []
-        for bot in self.__bots:
-            thread = threading.Thread(target=bot.start)
-            thread.start()
+        asyncio.run(self.__run_bots())
 
-            threads.append(thread)
+    async def __run_bots(self) -> None:
+        await asyncio.gather(*(bot.start() for bot in self.__bots))
 
-        for thread in threads:
-            thread.join()
+    @staticmethod
+    def __copy_folder(source_path: str, destination_path: str) -> None:
+        # Plain content copy, shutil.copyfile() uses fast in-kernel copying where available.
+        os.makedirs(destination_path, exist_ok=True)
+
+        with os.scandir(source_path) as entries:
+            for entry in entries:
+                destination_entry_path = os.path.join(destination_path, entry.name)
+                if entry.is_dir():
+                    Nidibot.__copy_folder(entry.path, destination_entry_path)
+                else:
+                    shutil.copyfile(entry.path, destination_entry_path)
 
     @staticmethod
     def initialize_folder() -> None:
@@ -172,38 +254,40 @@ class Nidibot:
         """
         current_script_folder = os.path.dirname(os.path.realpath(__file__))
         current_working_folder = os.getcwd()
-        shutil.copytree(
+        Nidibot.__copy_folder(
             os.path.join(current_script_folder, "templates", "common"),
             current_working_folder,
-            dirs_exist_ok=True,
         )
 
         if platform.system() == "Linux":
-            shutil.copytree(
+            Nidibot.__copy_folder(
                 os.path.join(current_script_folder, "templates", "linux"),
                 current_working_folder,
-                dirs_exist_ok=True,
             )
 
             #
             # Modify path to working folder in "nidibot.service" file.
             #
-            file_lines: list = []
             service_filepath = os.path.join(current_working_folder, "nidibot.service")
             with open(
                 file=service_filepath, mode="r", encoding="utf-8"
             ) as service_file:
-                file_lines = service_file.readlines()
+                service_content = service_file.read()
 
-            for line_index, line in enumerate(file_lines):
-                if "ExecStart=/user/bin/python3 /home/nidibot/start_bot.py" in line:
-                    script_filepath = os.path.join(
-                        current_working_folder, "start_bot.py"
-                    )
-                    edited_line = f"ExecStart=/user/bin/python3 {script_filepath}\n"
-                    file_lines[line_index] = edited_line
-
-            with open(
-                file=service_filepath, mode="w", encoding="utf-8"
-            ) as service_file:
-                service_file.writelines(file_lines)
+            #
+            # Service file is only rewritten if it still points to the template location.
+            #
+            template_exec_start = (
+                "ExecStart=/user/bin/python3 /home/nidibot/start_bot.py"
+            )
+            if template_exec_start in service_content:
+                script_filepath = os.path.join(current_working_folder, "start_bot.py")
+                service_content = service_content.replace(
+                    template_exec_start,
+                    f"ExecStart=/user/bin/python3 {script_filepath}",
+                )
+
+                with open(
+                    file=service_filepath, mode="w", encoding="utf-8"
+                ) as service_file:
+                    service_file.write(service_content)
@@ -8,22 +8,27 @@ Components for managing Nitrado server provider.
 
 """
 
-import glob
-import json
 import logging
 import os
 import pathlib
+import posixpath
+import queue
+import random
 import shutil
 import subprocess
 import tempfile
 import threading
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import ftputil  # type: ignore
+import orjson
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry
 
 from nidibot.bots.bot_base import BackupDescription
 from nidibot.server_provider.game_server import GameServer
@@ -47,6 +52,9 @@ class NitradoService:
     available_until: str = ""
     """The date until game server is available."""
 
+    gameservers_url: str = ""
+    """The API endpoint with game server details of this service."""
+
 
 @dataclass
 class NitradoFtpConfiguration:
@@ -79,6 +87,9 @@ class NitradoServerInformation:
     short_name: str = ""
     """The name of the game in lowercase."""
 
+    action_urls: Dict[str, str] = field(default_factory=dict)
+    """The API endpoints of game server actions, e.g. `stop` or `restart`."""
+
     status: ServerStatus = field(default_factory=ServerStatus)
     ftp: NitradoFtpConfiguration = field(default_factory=NitradoFtpConfiguration)
     mysql: NitradoMysqlConfiguration = field(default_factory=NitradoMysqlConfiguration)
@@ -102,16 +113,95 @@ class NitradoServerProvider(ServerProviderBase):
         )
         self.__servers: Dict[str, NitradoServerInformation] = {}
 
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s:%(levelname)s:%(funcName)s %(message)s",
-            handlers=[logging.StreamHandler()],
+        # Single session keeps connections to Nitrado API alive between requests.
+        self.__session = requests.Session()
+        self.__session.headers.update({"Authorization": self._configuration.token})
+
+        # Connection pool is sized for all polling workers hitting the API at once.
+        polling_workers_count = 8
+        self.__session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=polling_workers_count,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+
+        self.__polling_executor = ThreadPoolExecutor(max_workers=polling_workers_count)
+        self.__ftp_connections_count = 4
+        self.__copy_buffer_size = 1024 * 1024
+        self.__spooled_file_max_size = 16 * 1024 * 1024
+        self.__ftp_modification_time_precision_seconds = 60
+        self.__ftp_stat_cache_size = 100000
+        self.__backup_manifest_filename = "manifest.json"
+
+        # These file types are already compressed and are stored without deflating.
+        self.__stored_file_extensions = frozenset(
+            [
+                ".7z",
+                ".bz2",
+                ".gz",
+                ".jar",
+                ".jpeg",
+                ".jpg",
+                ".mp3",
+                ".mp4",
+                ".ogg",
+                ".pak",
+                ".png",
+                ".rar",
+                ".xz",
+                ".zip",
+                ".zst",
+            ]
+        )
+        self.__statuses = {"started": "online", "stopped": "offline"}
+
+        # Watched status fields with their notification switch and message template.
+        self.__status_change_notifications = (
+            (
+                "on_status_change",
+                "status",
+                "Status changed from '{0}' to '{1}'.".format,
+            ),
+            ("on_address_change", "address", "Address from '{0}' to '{1}'.".format),
+            ("on_version_change", "version", "Version from '{0}' to '{1}'.".format),
+            (
+                "on_update_available_change",
+                "update_available",
+                "Update is available, please restart server.".format,
+            ),
         )
 
+        # Services list changes rarely, so it is refreshed less often than game servers.
+        self.__services: List[NitradoService] = []
+        self.__services_ttl_seconds = 300
+        self.__services_expiration_time = 0.0
+
+        # Last response of each service, unchanged responses reuse already parsed server.
+        self.__server_responses: Dict[
+            str, Tuple[bytes, NitradoService, NitradoServerInformation, str]
+        ] = {}
+
         self.__verify_api_version()
 
+        #
+        # Polling slows down while nothing changes and returns to configured
+        # interval on any change or user action.
+        #
+        self.__polling_seconds = self._configuration.polling_seconds
+        self.__idle_polling_seconds = max(self._configuration.polling_seconds, 60)
+        self.__unchanged_polls_count = 0
+        self.__unchanged_polls_before_slowdown = 12
+        self.__polling_jitter_seconds = 0.5
+
         self.__data_received_event = threading.Event()
         self.__stopping_event = threading.Event()
+        self.__polling_wakeup_event = threading.Event()
 
         self.__polling_thread = threading.Thread(target=self._poll)
         self.__polling_thread.daemon = True
@@ -120,18 +210,20 @@ class NitradoServerProvider(ServerProviderBase):
         self.__data_received_event.wait()
 
     def __verify_api_version(self) -> None:
-        response = requests.get(
+        response = self.__session.get(
             "https://api.nitrado.net/version",
             timeout=self._configuration.timeout_seconds,
         )
 
-        logging.debug(
-            "Response received, status code: %d, content: %s.",
-            response.status_code,
-            response.content.decode("utf-8"),
-        )
+        # Body is decoded only if it is going to be logged.
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Response received, status code: %d, content: %s.",
+                response.status_code,
+                response.content.decode("utf-8"),
+            )
 
-        content_json = json.loads(response.content.decode("utf-8"))
+        content_json = orjson.loads(response.content)
 
         if response.status_code != 200:
             raise ValueError("Failed reading Nitrado API version!")
@@ -148,71 +240,300 @@ class NitradoServerProvider(ServerProviderBase):
                 content_json["message"],
             )
 
+    def __create_ftp_host(self, ftp_configuration: NitradoFtpConfiguration):
+        return ftputil.FTPHost(
+            ftp_configuration.hostname,
+            ftp_configuration.username,
+            ftp_configuration.password,
+        )
+
     def __download_ftp_folder(
-        self, ftp_server, local_path: str, remote_path: str, ignore_folders: list
+        self,
+        ftp_configuration: NitradoFtpConfiguration,
+        archive: zipfile.ZipFile,
+        archive_path: str,
+        remote_path: str,
+        ignore_folders: list,
+        previous_archive_filepath: str = "",
     ):
-        for root_path, folders, files in ftp_server.walk(top=remote_path, topdown=True):
-            root_folder_name = os.path.basename(root_path)
-            if root_folder_name in ignore_folders:
-                return
+        (
+            previous_archive,
+            previous_file_states,
+            settled_modification_time,
+        ) = self.__open_previous_backup(previous_archive_filepath)
+
+        #
+        # Folder walk produces files to download while worker threads consume
+        # them, each worker with its own connection. Downloaded files are spooled
+        # in memory (or to disk if large) and then written into the archive one at a time.
+        #
+        file_states: Dict[str, list] = {}
+        filepaths_queue: queue.Queue = queue.Queue(maxsize=256)
+        archive_mutex = threading.Lock()
+        download_errors: List[Exception] = []
+        download_counters = {"files": 0, "bytes": 0}
+
+        def download_files() -> None:
+            ftp_server = None
+            try:
+                while True:
+                    filepath = filepaths_queue.get()
+                    if filepath is None:
+                        return
+
+                    # After a failure the queue is still drained, so the walk never blocks.
+                    if download_errors:
+                        continue
+
+                    try:
+                        if ftp_server is None:
+                            ftp_server = self.__create_ftp_host(ftp_configuration)
+
+                        remote_filepath, archive_filepath = filepath
+                        with tempfile.SpooledTemporaryFile(
+                            max_size=self.__spooled_file_max_size
+                        ) as spooled_file:
+                            with ftp_server.open(remote_filepath, "rb") as remote_file:
+                                shutil.copyfileobj(
+                                    remote_file, spooled_file, self.__copy_buffer_size
+                                )
+
+                            spooled_file.seek(0)
+                            with archive_mutex:
+                                with archive.open(
+                                    self.__create_archive_file_info(archive_filepath),
+                                    "w",
+                                    force_zip64=True,
+                                ) as archive_file:
+                                    shutil.copyfileobj(
+                                        spooled_file,
+                                        archive_file,
+                                        self.__copy_buffer_size,
+                                    )
+
+                                download_counters["files"] += 1
+                                download_counters["bytes"] += file_states[
+                                    archive_filepath
+                                ][0]
+
+                    except Exception as exception:
+                        download_errors.append(exception)
+
+            finally:
+                if ftp_server is not None:
+                    ftp_server.close()
+
+        workers = [
+            threading.Thread(target=download_files)
+            for _ in range(self.__ftp_connections_count)
+        ]
+        for worker in workers:
+            worker.start()
+
+        copied_files_count = 0
+        try:
+            with self.__create_ftp_host(ftp_configuration) as ftp_server:
+                # Each folder is listed once, file types and stats are then served
+                # from the cache, it only has to fit the largest folder.
+                ftp_server.stat_cache.resize(self.__ftp_stat_cache_size)
+
+                for root_path, folders, files in ftp_server.walk(
+                    top=remote_path, topdown=True
+                ):
+                    # Pruning folders in-place stops walk() from descending into them.
+                    folders[:] = [x for x in folders if x not in ignore_folders]
+
+                    archive_folder_path = posixpath.join(
+                        archive_path, posixpath.relpath(root_path, remote_path)
+                    )
 
-            for filename in files:
-                remote_filepath = ftp_server.path.join(root_path, filename)
-                local_filepath = os.path.join(local_path, remote_filepath)
-                local_parent_folder = pathlib.Path(local_filepath).parent.absolute()
-                pathlib.Path(local_parent_folder).mkdir(parents=True, exist_ok=True)
-                ftp_server.download(remote_filepath, local_filepath)
-                logging.debug(
-                    "Downloaded '%s' to '%s'.", remote_filepath, local_filepath
-                )
+                    for filename in files:
+                        remote_filepath = ftp_server.path.join(root_path, filename)
+                        archive_filepath = posixpath.normpath(
+                            posixpath.join(archive_folder_path, filename)
+                        )
 
-            for folder_name in folders:
-                self.__download_ftp_folder(
-                    ftp_server=ftp_server,
-                    local_path=local_path,
-                    remote_path=os.path.join(root_path, folder_name),
-                    ignore_folders=ignore_folders,
-                )
+                        # Served from stat cache filled by walk().
+                        stat_result = ftp_server.stat(remote_filepath)
+                        file_state = [stat_result.st_size, stat_result.st_mtime]
+                        file_states[archive_filepath] = file_state
+
+                        #
+                        # A file is taken from previous backup only if it is the same
+                        # and was not modified shortly before that backup was made.
+                        #
+                        previous_file_state = previous_file_states.get(archive_filepath)
+                        if (
+                            previous_archive is not None
+                            and previous_file_state == file_state
+                            and previous_file_state[1] <= settled_modification_time
+                        ):
+                            with previous_archive.open(
+                                archive_filepath
+                            ) as previous_file, archive_mutex, archive.open(
+                                self.__create_archive_file_info(archive_filepath),
+                                "w",
+                                force_zip64=True,
+                            ) as archive_file:
+                                shutil.copyfileobj(
+                                    previous_file, archive_file, self.__copy_buffer_size
+                                )
+
+                            copied_files_count += 1
+                            continue
+
+                        filepaths_queue.put((remote_filepath, archive_filepath))
+
+        finally:
+            for _ in workers:
+                filepaths_queue.put(None)
+
+            for worker in workers:
+                worker.join()
+
+            if previous_archive is not None:
+                previous_archive.close()
+
+        if download_errors:
+            raise download_errors[0]
+
+        logging.debug(
+            "Copied %d unchanged files from previous backup '%s'.",
+            copied_files_count,
+            previous_archive_filepath,
+        )
+        logging.debug(
+            "Downloaded %d files (%.1f MiB) from '%s'.",
+            download_counters["files"],
+            download_counters["bytes"] / (1024 * 1024),
+            remote_path,
+        )
+
+        archive.writestr(self.__backup_manifest_filename, orjson.dumps(file_states))
+
+    def __create_archive_file_info(self, archive_filepath: str) -> zipfile.ZipInfo:
+        file_info = zipfile.ZipInfo(archive_filepath, time.localtime()[:6])
+        if (
+            posixpath.splitext(archive_filepath)[1].lower()
+            in self.__stored_file_extensions
+        ):
+            file_info.compress_type = zipfile.ZIP_STORED
+        else:
+            file_info.compress_type = zipfile.ZIP_DEFLATED
 
-            return
+        return file_info
+
+    def __open_previous_backup(
+        self, previous_archive_filepath: str
+    ) -> Tuple[Optional[zipfile.ZipFile], Dict[str, list], float]:
+        if not previous_archive_filepath:
+            return None, {}, 0.0
+
+        try:
+            previous_archive = zipfile.ZipFile(previous_archive_filepath)
+        except (OSError, zipfile.BadZipFile) as exception:
+            logging.warning("Failed opening previous backup: %s.", exception)
+            return None, {}, 0.0
+
+        try:
+            previous_file_states = orjson.loads(
+                previous_archive.read(self.__backup_manifest_filename)
+            )
+        except (KeyError, orjson.JSONDecodeError):
+            previous_file_states = {}
+
+        if not previous_file_states:
+            previous_archive.close()
+            return None, {}, 0.0
+
+        #
+        # FTP listings often state modification time with a minute precision.
+        # A file modified within that precision before the newest one seen back then
+        # could have been written again later within the same minute.
+        #
+        settled_modification_time = (
+            max(x[1] for x in previous_file_states.values())
+            - self.__ftp_modification_time_precision_seconds
+        )
+
+        return previous_archive, previous_file_states, settled_modification_time
 
     def __upload_ftp_folder(
-        self, ftp_server, local_path: str, remote_path: str, ignore_folders: list
+        self,
+        ftp_configuration: NitradoFtpConfiguration,
+        local_path: str,
+        remote_path: str,
+        ignore_folders: list,
     ):
+        #
+        # Collect all files and remote folders from a single walk first.
+        #
+        filepaths: List[Tuple[str, str]] = []
+        remote_folder_paths: List[str] = []
         for root_path, folders, files in os.walk(top=local_path, topdown=True):
-            root_folder_name = os.path.basename(root_path)
-            if root_folder_name in ignore_folders:
-                return
+            # Pruning folders in-place stops walk() from descending into them.
+            folders[:] = [x for x in folders if x not in ignore_folders]
+
+            remote_folder_path = posixpath.normpath(
+                posixpath.join(
+                    remote_path,
+                    pathlib.PurePath(os.path.relpath(root_path, local_path)).as_posix(),
+                )
+            )
+            if files and remote_folder_path != ".":
+                remote_folder_paths.append(remote_folder_path)
 
             for filename in files:
-                local_filepath = os.path.join(root_path, filename)
-                remote_filepath = ftp_server.path.join(remote_path, filename)
+                filepaths.append(
+                    (
+                        os.path.join(root_path, filename),
+                        posixpath.join(remote_folder_path, filename),
+                    )
+                )
 
-                if remote_path != ".":
-                    ftp_server.makedirs(remote_path, exist_ok=True)
+        with self.__create_ftp_host(ftp_configuration) as ftp_server:
+            for remote_folder_path in remote_folder_paths:
+                ftp_server.makedirs(remote_folder_path, exist_ok=True)
 
-                ftp_server.upload(local_filepath, remote_filepath)
-                logging.debug("Uploaded '%s' to '%s'.", local_filepath, remote_filepath)
+        #
+        # Upload files in parallel, each worker thread has its own connection.
+        #
+        thread_data = threading.local()
+        ftp_servers: list = []
+        ftp_servers_mutex = threading.Lock()
 
-            for folder_name in folders:
-                self.__upload_ftp_folder(
-                    ftp_server=ftp_server,
-                    local_path=os.path.join(root_path, folder_name),
-                    remote_path=os.path.join(remote_path, folder_name),
-                    ignore_folders=ignore_folders,
-                )
+        def upload_file(filepath: Tuple[str, str]) -> None:
+            if not hasattr(thread_data, "ftp_server"):
+                thread_data.ftp_server = self.__create_ftp_host(ftp_configuration)
+                with ftp_servers_mutex:
+                    ftp_servers.append(thread_data.ftp_server)
+
+            local_filepath, remote_filepath = filepath
+            thread_data.ftp_server.upload(local_filepath, remote_filepath)
 
-            return
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.__ftp_connections_count
+            ) as executor:
+                for _ in executor.map(upload_file, filepaths):
+                    pass
+
+        finally:
+            for ftp_server in ftp_servers:
+                ftp_server.close()
+
+        logging.debug("Uploaded %d files to '%s'.", len(filepaths), remote_path)
 
     def __get_services(self) -> list:
+        if self.__services and time.monotonic() < self.__services_expiration_time:
+            return self.__services
+
         service_list = []
 
         try:
-            headers = {"Authorization": self._configuration.token}
-            response = requests.get(
+            response = self.__session.get(
                 "https://api.nitrado.net/services",
                 timeout=self._configuration.timeout_seconds,
-                headers=headers,
             )
 
             logging.debug(
@@ -220,7 +541,7 @@ class NitradoServerProvider(ServerProviderBase):
                 response.status_code,
             )
 
-            content_json = json.loads(response.content.decode("utf-8"))
+            content_json = orjson.loads(response.content)
             data_service_list = content_json["data"]["services"]
             for data_service in data_service_list:
                 service: NitradoService = NitradoService()
@@ -230,162 +551,233 @@ class NitradoServerProvider(ServerProviderBase):
                 service.available_until = str(data_service["suspend_date"]).replace(
                     "T", " "
                 )
+                service.gameservers_url = (
+                    f"https://api.nitrado.net/services/{service.id}/gameservers"
+                )
 
                 service_list.append(service)
 
+            self.__services = service_list
+            self.__services_expiration_time = (
+                time.monotonic() + self.__services_ttl_seconds
+            )
+
         except Exception as exception:
             logging.exception(exception)
 
         return service_list
 
-    def _poll(self) -> None:
-        logging.debug("Polling thread started.")
+    def __get_server_information(
+        self, service: NitradoService
+    ) -> Optional[NitradoServerInformation]:
+        try:
+            #
+            # API is asked to skip the body if it did not change since the last response.
+            # Cached response is usable only while its service entry is unchanged.
+            #
+            server_response = self.__server_responses.get(service.id)
+            if server_response is not None and server_response[1] != service:
+                server_response = None
 
-        while not self.__stopping_event.is_set():
-            servers: Dict[str, NitradoServerInformation] = {}
-            services = self.__get_services()
-            for service in services:
-                try:
-                    headers = {"Authorization": self._configuration.token}
-                    response = requests.get(
-                        f"https://api.nitrado.net/services/{service.id}/gameservers",
-                        timeout=self._configuration.timeout_seconds,
-                        headers=headers,
-                    )
+            headers = {}
+            if server_response is not None and server_response[3]:
+                headers["If-None-Match"] = server_response[3]
 
-                    logging.debug(
-                        "Response received, status code: %d.",
-                        response.status_code,
-                    )
+            response = self.__session.get(
+                service.gameservers_url,
+                headers=headers,
+                timeout=self._configuration.timeout_seconds,
+            )
 
-                    content_json = json.loads(response.content.decode("utf-8"))
-                    gameserver_dict = content_json["data"]["gameserver"]
-                    query_dict = gameserver_dict["query"]
-
-                    server: NitradoServerInformation = NitradoServerInformation()
-                    server.id = str(service.id)
-                    server.short_name = service.short_name
-                    server.status.game_name = gameserver_dict["game_human"]
-                    server.status.update_available = (
-                        gameserver_dict["game_specific"]["update_status"]
-                        != "up_to_date"
-                    )
-                    server.status.available_until = service.available_until
+            logging.debug(
+                "Response received, status code: %d.",
+                response.status_code,
+            )
 
-                    if gameserver_dict["status"] == "started":
-                        server.status.status = "online"
-                    elif gameserver_dict["status"] == "stopped":
-                        server.status.status = "offline"
-                    else:
-                        server.status.status = str(gameserver_dict["status"])
+            if server_response is not None and (
+                response.status_code == 304 or server_response[0] == response.content
+            ):
+                return server_response[2]
 
-                    if len(query_dict) > 0:
-                        server.status.version = gameserver_dict["query"]["version"]
-                        server.status.address = gameserver_dict["query"]["connect_ip"]
-                        server.status.players_limit = int(
-                            gameserver_dict["query"]["player_max"]
-                        )
-                        server.status.players_connected = int(
-                            gameserver_dict["query"]["player_current"]
-                        )
-                        server.status.player_names = gameserver_dict["query"]["players"]
-                    else:
-                        server.status.address = (
-                            str(gameserver_dict["ip"])
-                            + ":"
-                            + str(gameserver_dict["query_port"])
-                        )
-                        server.status.players_limit = int(gameserver_dict["slots"])
-                        server.status.player_names = []
+            if response.status_code != 200:
+                raise ValueError(
+                    f"Failed reading game server information, status code: {response.status_code}!"
+                )
 
-                    ftp_dict = content_json["data"]["gameserver"]["credentials"]["ftp"]
+            content_json = orjson.loads(response.content)
+            gameserver_dict = content_json["data"]["gameserver"]
+            query_dict = gameserver_dict["query"]
+
+            server: NitradoServerInformation = NitradoServerInformation()
+            server.id = str(service.id)
+            server.short_name = service.short_name
+            server.action_urls = {
+                action: f"{service.gameservers_url}/{action}"
+                for action in ("stop", "restart")
+            }
+            server.status.game_name = gameserver_dict["game_human"]
+            server.status.update_available = (
+                gameserver_dict["game_specific"]["update_status"] != "up_to_date"
+            )
+            server.status.available_until = service.available_until
 
-                    server.ftp.hostname = ftp_dict["hostname"]
-                    server.ftp.port = int(ftp_dict["port"])
-                    server.ftp.username = ftp_dict["username"]
-                    server.ftp.password = ftp_dict["password"]
+            server.status.status = self.__statuses.get(
+                gameserver_dict["status"], str(gameserver_dict["status"])
+            )
 
-                    mysql_dict = content_json["data"]["gameserver"]["credentials"][
-                        "mysql"
-                    ]
+            if len(query_dict) > 0:
+                server.status.version = gameserver_dict["query"]["version"]
+                server.status.address = gameserver_dict["query"]["connect_ip"]
+                server.status.players_limit = int(
+                    gameserver_dict["query"]["player_max"]
+                )
+                server.status.players_connected = int(
+                    gameserver_dict["query"]["player_current"]
+                )
+                server.status.player_names = gameserver_dict["query"]["players"]
+            else:
+                server.status.address = (
+                    str(gameserver_dict["ip"])
+                    + ":"
+                    + str(gameserver_dict["query_port"])
+                )
+                server.status.players_limit = int(gameserver_dict["slots"])
+                server.status.player_names = []
 
-                    server.mysql.hostname = mysql_dict["hostname"]
-                    server.mysql.port = int(mysql_dict["port"])
-                    server.mysql.username = mysql_dict["username"]
-                    server.mysql.password = mysql_dict["password"]
-                    server.mysql.database = mysql_dict["database"]
+            ftp_dict = content_json["data"]["gameserver"]["credentials"]["ftp"]
 
-                    servers[server.id] = server
+            server.ftp.hostname = ftp_dict["hostname"]
+            server.ftp.port = int(ftp_dict["port"])
+            server.ftp.username = ftp_dict["username"]
+            server.ftp.password = ftp_dict["password"]
+
+            mysql_dict = content_json["data"]["gameserver"]["credentials"]["mysql"]
+
+            server.mysql.hostname = mysql_dict["hostname"]
+            server.mysql.port = int(mysql_dict["port"])
+            server.mysql.username = mysql_dict["username"]
+            server.mysql.password = mysql_dict["password"]
+            server.mysql.database = mysql_dict["database"]
+
+            self.__server_responses[service.id] = (
+                response.content,
+                service,
+                server,
+                response.headers.get("ETag", ""),
+            )
+
+            return server
+
+        except Exception as exception:
+            logging.exception(exception)
+            return None
+
+    def _poll(self) -> None:
+        logging.debug("Polling thread started.")
 
-                except Exception as exception:
-                    logging.exception(exception)
+        while not self.__stopping_event.is_set():
+            polling_start_time = time.monotonic()
+            servers: Dict[str, NitradoServerInformation] = {}
+            services = self.__get_services()
+
+            #
+            # Services are independent, so their game servers are requested in parallel.
+            # Executor refuses new work once interpreter shutdown has started.
+            #
+            try:
+                server_list = self.__polling_executor.map(
+                    self.__get_server_information, services
+                )
+            except RuntimeError:
+                logging.debug("Polling executor is shut down, polling is stopped.")
+                self.__stopping_event.set()
+                break
+
+            for server in server_list:
+                if server is not None:
+                    servers[server.id] = server
 
             #
             # Check for changes in status and notify.
             #
             if len(self.__servers) > 0:
+                notifications = self._configuration.notifications
                 for server_id, server in servers.items():
-                    title = f"{server.status.game_name}"
-                    if server.status.version:
-                        title += f" ({server.status.version})"
-
-                    title += f" - {server.status.address}"
-
-                    if (
-                        self._configuration.notifications.on_new_server
-                        and server_id not in self.__servers
-                    ):
-                        self._notify_callback(
-                            title, "New game server appeared, please configure it."
-                        )
-
-                    if (
-                        self._configuration.notifications.on_status_change
-                        and server.status.status
-                        != self.__servers[server_id].status.status
-                    ):
-                        self._notify_callback(
-                            title,
-                            f"Status changed from '{self.__servers[server_id].status.status}' to "
-                            f"'{server.status.status}'.",
-                        )
+                    previous_server = self.__servers.get(server_id)
+
+                    # Unchanged response gives back the very same server object.
+                    if server is previous_server:
+                        continue
+
+                    status = server.status
+                    title = f"{status.game_name}"
+                    if status.version:
+                        title += f" ({status.version})"
+
+                    title += f" - {status.address}"
+
+                    if previous_server is None:
+                        if notifications.on_new_server:
+                            self._notify_callback(
+                                title, "New game server appeared, please configure it."
+                            )
+
+                        continue
+
+                    previous_status = previous_server.status
+                    for (
+                        notification,
+                        field_name,
+                        format_message,
+                    ) in self.__status_change_notifications:
+                        previous_value = getattr(previous_status, field_name)
+                        value = getattr(status, field_name)
+                        if getattr(notifications, notification) and (
+                            value != previous_value
+                        ):
+                            self._notify_callback(
+                                title, format_message(previous_value, value)
+                            )
+
+            if servers.keys() == self.__servers.keys() and all(
+                server is self.__servers[server_id]
+                for server_id, server in servers.items()
+            ):
+                self.__unchanged_polls_count += 1
+                if (
+                    self.__unchanged_polls_count
+                    >= self.__unchanged_polls_before_slowdown
+                ):
+                    self.__polling_seconds = min(
+                        self.__polling_seconds * 2, self.__idle_polling_seconds
+                    )
+            else:
+                self.__unchanged_polls_count = 0
+                self.__polling_seconds = self._configuration.polling_seconds
 
-                    if (
-                        self._configuration.notifications.on_address_change
-                        and server.status.address
-                        != self.__servers[server_id].status.address
-                    ):
-                        self._notify_callback(
-                            title,
-                            f"Address from '{self.__servers[server_id].status.address}' to "
-                            f"'{server.status.address}'.",
-                        )
+            self.__servers = servers
+            self._notify_status_updated()
 
-                    if (
-                        self._configuration.notifications.on_version_change
-                        and server.status.version
-                        != self.__servers[server_id].status.version
-                    ):
-                        self._notify_callback(
-                            title,
-                            f"Version from '{self.__servers[server_id].status.version}' to "
-                            f"'{server.status.version}'.",
-                        )
+            self.__data_received_event.set()
 
-                    if (
-                        self._configuration.notifications.on_update_available_change
-                        and server.status.update_available
-                        != self.__servers[server_id].status.update_available
-                    ):
-                        self._notify_callback(
-                            title,
-                            "Update is available, please restart server.",
-                        )
+            #
+            # Time spent on requests is counted into the interval, small random delay
+            # keeps several bots from hitting the API at the same moment.
+            #
+            polling_elapsed_seconds = time.monotonic() - polling_start_time
+            self.__polling_wakeup_event.wait(
+                max(0.0, self.__polling_seconds - polling_elapsed_seconds)
+                + random.uniform(0.0, self.__polling_jitter_seconds)
+            )
+            self.__polling_wakeup_event.clear()
 
-            self.__servers = servers
+        self.__polling_executor.shutdown(wait=False)
+        logging.debug("Polling thread stopped.")
 
-            self.__data_received_event.set()
-            self.__stopping_event.wait(self._configuration.polling_seconds)
+    def __poll_now(self) -> None:
+        self.__unchanged_polls_count = 0
+        self.__polling_seconds = self._configuration.polling_seconds
+        self.__polling_wakeup_event.set()
 
     def name(self) -> str:
         return "Nitrado"
@@ -408,21 +800,27 @@ class NitradoServerProvider(ServerProviderBase):
         return self.restart(server_id)
 
     def stop(self, server_id: str = "") -> bool:
+        return self.__post_action(server_id=server_id, action="stop")
+
+    def restart(self, server_id: str = "") -> bool:
+        return self.__post_action(server_id=server_id, action="restart")
+
+    def __post_action(self, server_id: str, action: str) -> bool:
         try:
-            headers = {"Authorization": self._configuration.token}
-            response = requests.post(
-                f"https://api.nitrado.net/services/{server_id}/gameservers/stop",
+            response = self.__session.post(
+                self.__servers[server_id].action_urls[action],
                 timeout=self._configuration.timeout_seconds,
-                headers=headers,
             )
+            self.__poll_now()
 
-            logging.debug(
-                "Response received, status code: %d, content: %s.",
-                response.status_code,
-                response.content.decode("utf-8"),
-            )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "Response received, status code: %d, content: %s.",
+                    response.status_code,
+                    response.content.decode("utf-8"),
+                )
 
-            content_json = json.loads(response.content.decode("utf-8"))
+            content_json = orjson.loads(response.content)
 
             return response.status_code == 200 and content_json["status"] == "success"
 
@@ -430,110 +828,102 @@ class NitradoServerProvider(ServerProviderBase):
             logging.exception(exception)
             return False
 
-    def restart(self, server_id: str = "") -> bool:
+    def create_backup(self, server_id: str = "") -> bool:
         try:
-            headers = {"Authorization": self._configuration.token}
-            response = requests.post(
-                f"https://api.nitrado.net/services/{server_id}/gameservers/restart",
-                timeout=self._configuration.timeout_seconds,
-                headers=headers,
-            )
+            start_time = time.time()
+            datetime_str = time.strftime("%Y%m%d_%H%M%S")
 
-            logging.debug(
-                "Response received, status code: %d, content: %s.",
-                response.status_code,
-                response.content.decode("utf-8"),
+            backup_directory = self._get_backup_directory_path(
+                game_name=self.__servers[server_id].short_name, server_id=server_id
             )
+            pathlib.Path(backup_directory).mkdir(parents=True, exist_ok=True)
 
-            content_json = json.loads(response.content.decode("utf-8"))
-
-            return response.status_code == 200 and content_json["status"] == "success"
+            #
+            # Archive is written under a hidden name and renamed once completed,
+            # so unfinished backups never appear in the list of backups.
+            #
+            archive_filepath = os.path.join(backup_directory, f"{datetime_str}.zip")
+            temp_archive_filepath = os.path.join(
+                backup_directory, f".{datetime_str}.zip"
+            )
 
-        except Exception as exception:
-            logging.exception(exception)
-            return False
+            backups = self.list_backups(server_id=server_id)
+            previous_archive_filepath = backups[0].filepath if backups else ""
 
-    def create_backup(self, server_id: str = "") -> bool:
-        try:
-            start_time = time.time()
-            with tempfile.TemporaryDirectory() as temp_folder_path:
-                datetime_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                local_path = os.path.join(temp_folder_path, datetime_str)
-                pathlib.Path(local_path).mkdir(parents=True, exist_ok=True)
-
-                #
-                # Copy game server files via FTP to temporary folder.
-                #
-                files_path = os.path.join(local_path, "files")
-                with ftputil.FTPHost(
-                    self.__servers[server_id].ftp.hostname,
-                    self.__servers[server_id].ftp.username,
-                    self.__servers[server_id].ftp.password,
-                ) as ftp:
+            try:
+                with zipfile.ZipFile(
+                    temp_archive_filepath, "w", compression=zipfile.ZIP_DEFLATED
+                ) as archive:
+                    #
+                    # Copy game server files via FTP directly into archive.
+                    #
                     self.__download_ftp_folder(
-                        ftp_server=ftp,
-                        local_path=files_path,
+                        ftp_configuration=self.__servers[server_id].ftp,
+                        archive=archive,
+                        archive_path="files",
                         remote_path=".",
                         ignore_folders=["Crashes", "CrashReportClient"],
+                        previous_archive_filepath=previous_archive_filepath,
                     )
 
-                #
-                # Save MySQL database to temporary folder.
-                #
-                mysqldump_path = shutil.which("mysqldump")
-                if mysqldump_path is not None:
-                    database_name = self.__servers[server_id].mysql.database
-                    mysql_folder_path = os.path.join(local_path, "mysql")
-                    pathlib.Path(mysql_folder_path).mkdir(parents=True, exist_ok=True)
-                    database_filepath = os.path.join(
-                        mysql_folder_path, database_name + ".sql"
-                    )
-
-                    mysqldump_command = (
-                        f"{mysqldump_path} --host {self.__servers[server_id].mysql.hostname} "
-                        f"--port {str(self.__servers[server_id].mysql.port)} "
-                        f"--user {self.__servers[server_id].mysql.username} "
-                        f"-p{self.__servers[server_id].mysql.password} "
-                        f"{database_name} > {database_filepath}"
-                    )
+                    #
+                    # Save MySQL database into archive.
+                    #
+                    mysqldump_path = shutil.which("mysqldump")
+                    if mysqldump_path is not None:
+                        mysql_configuration = self.__servers[server_id].mysql
+                        mysqldump_command = [
+                            mysqldump_path,
+                            "--host",
+                            mysql_configuration.hostname,
+                            "--port",
+                            str(mysql_configuration.port),
+                            "--user",
+                            mysql_configuration.username,
+                            f"-p{mysql_configuration.password}",
+                            mysql_configuration.database,
+                        ]
+
+                        #
+                        # Dump is streamed from mysqldump output directly into archive.
+                        #
+                        with tempfile.TemporaryFile() as stderr_file:
+                            with subprocess.Popen(
+                                mysqldump_command,
+                                stdout=subprocess.PIPE,
+                                stderr=stderr_file,
+                            ) as process:
+                                with archive.open(
+                                    posixpath.join(
+                                        "mysql", mysql_configuration.database + ".sql"
+                                    ),
+                                    "w",
+                                    force_zip64=True,
+                                ) as archive_file:
+                                    shutil.copyfileobj(
+                                        process.stdout,  # type: ignore
+                                        archive_file,
+                                        self.__copy_buffer_size,
+                                    )
+
+                                _ = process.wait()
+
+                            stderr_file.seek(0)
+                            for stderr_line in stderr_file.read().splitlines():
+                                logging.info(stderr_line.decode("utf-8", "replace"))
 
-                    # logging.debug("Executing: '%s'.", mysql_command)
-
-                    with subprocess.Popen(
-                        mysqldump_command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        shell=True,
-                        encoding="utf-8",
-                        universal_newlines=True,
-                        cwd=local_path,
-                    ) as process:
-                        for stdout_line in iter(process.stdout.readline, ""):  # type: ignore
-                            logging.info(stdout_line.replace("\n", ""))
-                        process.stdout.close()  # type: ignore
-                        _ = process.wait()
+                    else:
+                        logging.warning(
+                            "No mysqldump is available in the system, please install it."
+                        )
 
-                else:
-                    logging.warning(
-                        "No mysqldump is available in the system, please install it."
-                    )
+                os.replace(temp_archive_filepath, archive_filepath)
 
-                #
-                # Create ZIP archive.
-                #
-                backup_directory = self._get_backup_directory_path(
-                    game_name=self.__servers[server_id].short_name, server_id=server_id
-                )
-                pathlib.Path(backup_directory).mkdir(parents=True, exist_ok=True)
+            finally:
+                if os.path.exists(temp_archive_filepath):
+                    os.remove(temp_archive_filepath)
 
-                shutil.make_archive(
-                    os.path.join(backup_directory, datetime_str), "zip", local_path
-                )
-
-                logging.debug(
-                    "Created backup archive at path: '%s'.",
-                    os.path.join(backup_directory, datetime_str),
-                )
+            logging.debug("Created backup archive at path: '%s'.", archive_filepath)
 
             end_time = time.time()
             logging.debug("Backup creation took %s.", end_time - start_time)
@@ -563,52 +953,49 @@ class NitradoServerProvider(ServerProviderBase):
             # Copy game server files via FTP to temporary folder.
             #
             files_path = os.path.join(temp_folder_path, "files")
-            with ftputil.FTPHost(
-                self.__servers[server_id].ftp.hostname,
-                self.__servers[server_id].ftp.username,
-                self.__servers[server_id].ftp.password,
-            ) as ftp:
-                self.__upload_ftp_folder(
-                    ftp_server=ftp,
-                    local_path=files_path,
-                    remote_path=".",
-                    ignore_folders=["Crashes", "CrashReportClient"],
-                )
+            self.__upload_ftp_folder(
+                ftp_configuration=self.__servers[server_id].ftp,
+                local_path=files_path,
+                remote_path=".",
+                ignore_folders=["Crashes", "CrashReportClient"],
+            )
 
             #
             # Save MySQL database to temporary folder.
             #
             mysql_path = shutil.which("mysql")
             if mysql_path is not None:
-                database_name = self.__servers[server_id].mysql.database
+                mysql_configuration = self.__servers[server_id].mysql
                 database_filepath = os.path.join(
-                    temp_folder_path, "mysql", database_name + ".sql"
+                    temp_folder_path, "mysql", mysql_configuration.database + ".sql"
                 )
 
                 if os.path.exists(database_filepath):
-                    mysql_command = (
-                        f"{mysql_path} --host={self.__servers[server_id].mysql.hostname} "
-                        f"--port={str(self.__servers[server_id].mysql.port)} "
-                        f"--user={self.__servers[server_id].mysql.username} "
-                        f"--password={self.__servers[server_id].mysql.password} "
-                        f"{database_name} < {database_filepath}"
-                    )
+                    mysql_command = [
+                        mysql_path,
+                        f"--host={mysql_configuration.hostname}",
+                        f"--port={mysql_configuration.port}",
+                        f"--user={mysql_configuration.username}",
+                        f"--password={mysql_configuration.password}",
+                        mysql_configuration.database,
+                    ]
 
-                    # logging.debug("Executing: '%s'.", mysql_command)
-
-                    with subprocess.Popen(
-                        args=mysql_command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        shell=True,
-                        encoding="utf-8",
-                        universal_newlines=True,
-                        cwd=temp_folder_path,
-                    ) as process:
-                        for stdout_line in iter(process.stdout.readline, ""):  # type: ignore
-                            logging.info(stdout_line.replace("\n", ""))
-                        process.stdout.close()  # type: ignore
-                        _ = process.wait()
+                    #
+                    # Dump file is fed to mysql input directly, without a shell redirect.
+                    #
+                    with open(database_filepath, "rb") as database_file:
+                        with subprocess.Popen(
+                            mysql_command,
+                            stdin=database_file,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT,
+                            cwd=temp_folder_path,
+                        ) as process:
+                            for output_line in process.stdout:  # type: ignore
+                                logging.info(
+                                    output_line.decode("utf-8", "replace").rstrip("\n")
+                                )
+                            _ = process.wait()
                 else:
                     logging.warning("No MySQL database file found, nothing to restore!")
 
@@ -631,33 +1018,41 @@ class NitradoServerProvider(ServerProviderBase):
             game_name=self.__servers[server_id].short_name, server_id=server_id
         )
 
-        wildcard_path = os.path.join(backup_directory, "*")
-        file_list = glob.glob(wildcard_path)
-
         backups: List[BackupDescription] = []
-        for filepath in file_list:
-            pathlib_filepath = pathlib.Path(filepath)
-            extension = pathlib_filepath.suffix
-            filename = pathlib_filepath.name.replace(extension, "")
-            filename_parts = filename.split("_")
-            if len(filename_parts) < 2:
-                continue
-
-            date_str = filename_parts[-2]
-            time_str = filename_parts[-1]
-
-            date_val = datetime.strptime(date_str, "%Y%m%d")
-            time_val = datetime.strptime(time_str, "%H%M%S")
-
-            backup_description: BackupDescription = BackupDescription()
-            backup_description.filepath = filepath
-            backup_description.readable_name = (
-                f"{date_val.strftime('%Y-%m-%d')} {time_val.strftime('%H:%M:%S')}"
-            )
+        if not os.path.isdir(backup_directory):
+            return backups
+
+        with os.scandir(backup_directory) as entries:
+            for entry in entries:
+                # Hidden files are unfinished backups.
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+
+                filename_parts = os.path.splitext(entry.name)[0].split("_")
+                if len(filename_parts) < 2:
+                    continue
+
+                date_str = filename_parts[-2]
+                time_str = filename_parts[-1]
+
+                # Names are fixed width "YYYYMMDD_HHMMSS", slicing is enough to format them.
+                if not (
+                    len(date_str) == 8
+                    and date_str.isdigit()
+                    and len(time_str) == 6
+                    and time_str.isdigit()
+                ):
+                    continue
+
+                backup_description: BackupDescription = BackupDescription()
+                backup_description.filepath = entry.path
+                backup_description.readable_name = (
+                    f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]} "
+                    f"{time_str[:2]}:{time_str[2:4]}:{time_str[4:]}"
+                )
 
-            backups.append(backup_description)
+                backups.append(backup_description)
 
-        backups.sort()
-        backups.reverse()
+        backups.sort(reverse=True)
 
         return backups
@@ -9,7 +9,7 @@ Base components of server provider instances.
 """
 
 import os
-import time
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
@@ -108,6 +108,9 @@ class ServerProviderBase(ABC):
         self._root_backup_directory = backup_directory
         self._notify_callback = notify_callback
 
+        # Notified by the provider every time polled statuses were updated.
+        self._status_updated_condition = threading.Condition()
+
     @abstractmethod
     def _poll(self) -> None:
         pass
@@ -117,22 +120,21 @@ class ServerProviderBase(ABC):
             self._root_backup_directory, self.name().lower(), game_name, server_id
         )
 
+    def _notify_status_updated(self) -> None:
+        with self._status_updated_condition:
+            self._status_updated_condition.notify_all()
+
     def _wait_for_status(
         self,
         server_id: str,
         required_status: str,
         timeout_seconds: int = 60,
-        wait_step_seconds: int = 1,
     ) -> bool:
-        end_time = time.time() + timeout_seconds
-        while time.time() < end_time:
-            status = self.status(server_id)
-            if status.status == required_status:
-                return True
-
-            time.sleep(wait_step_seconds)
-
-        return False
+        with self._status_updated_condition:
+            return self._status_updated_condition.wait_for(
+                lambda: self.status(server_id).status == required_status,
+                timeout=timeout_seconds,
+            )
 
     @abstractmethod
     def get_servers(self) -> list:
@@ -39,13 +39,17 @@ class ServerProviderFactory:
             server_provider: created instance
         """
 
-        if configuration.type not in ServerProviderFactory.__supported_server_providers:
+        server_provider_class = ServerProviderFactory.__supported_server_providers.get(
+            configuration.type
+        )
+
+        if server_provider_class is None:
             if not configuration.type:
                 raise ValueError("Empty bot type provided!")
 
             raise ValueError("Unknown bot type provided!")
 
-        return ServerProviderFactory.__supported_server_providers[configuration.type](
+        return server_provider_class(
             configuration=configuration,
             backup_directory=root_backup_path,
             notify_callback=notify_callback,
@@ -67,15 +71,11 @@ class ServerProviderFactory:
             list: list of created instances
         """
 
-        server_providers: list = []
-
-        for configuration in configuration_list:
-            server_providers.append(
-                ServerProviderFactory.create(
-                    configuration=configuration,
-                    root_backup_path=root_backup_path,
-                    notify_callback=notify_callback,
-                )
+        return [
+            ServerProviderFactory.create(
+                configuration=configuration,
+                root_backup_path=root_backup_path,
+                notify_callback=notify_callback,
             )
-
-        return server_providers
+            for configuration in configuration_list
+        ]
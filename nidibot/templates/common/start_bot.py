@@ -8,16 +8,20 @@ import sys
 from nidibot import Nidibot
 
 
-def shutdown_signal_handler(_1, _2):
-    logging.critical("Caught SIGINT signal, nidibot will be shut down.")
+def shutdown_signal_handler(signal_number, _2):
+    logging.critical(
+        "Caught %s signal, nidibot will be shut down.",
+        signal.Signals(signal_number).name,
+    )
     sys.exit(0)
 
 
 if __name__ == "__main__":
     #
-    # Catch Ctrl+C signal for notifying about bureau shutdown.
+    # Catch Ctrl+C and service stop signals for notifying about bureau shutdown.
     #
     signal.signal(signal.SIGINT, shutdown_signal_handler)
+    signal.signal(signal.SIGTERM, shutdown_signal_handler)
 
     bot = Nidibot(os.path.dirname(os.path.realpath(__file__)))
     bot.start()